@@ -9,20 +9,25 @@ from psycopg2 import OperationalError as Pyscopg2Error
 from django.db.utils import OperationalError
 from django.core.management.base import BaseCommand
 
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+
 
 class Command(BaseCommand):
     """Django command to pause execution until database is available"""
 
     def handle(self, *args, **options):
-        self.stdout.write
-        db_up = False
-        while db_up is False:
+        self.stdout.write("Waiting for database...")
+        delay = INITIAL_DELAY
+        while True:
             try:
                 self.check(databases=["default"])
-                db_up = True
-                self.stdout.write(self.style.SUCCESS("Database available!"))
+                break
             except (Pyscopg2Error, OperationalError):
-                self.stdout.write("Database unavailable, waiting 1 second...")
-                time.sleep(1)
+                self.stdout.write(
+                    f"Database unavailable, waiting {delay:g} seconds..."
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_DELAY)
 
         self.stdout.write(self.style.SUCCESS("Database available!"))
@@ -27,4 +27,8 @@ class CommandTests(SimpleTestCase):
         call_command("wait_for_db")
 
         self.assertEqual(patched_check.call_count, 6)
+        self.assertEqual(
+            [c.args[0] for c in patched_sleep.call_args_list],
+            [0.1, 0.2, 0.4, 0.8, 1.6],
+        )
         patched_check.assert_called_with(databases=["default"])
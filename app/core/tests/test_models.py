@@ -1,61 +1,61 @@
 from decimal import Decimal
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from django.contrib.auth import get_user_model
 
 from core import models
 
+User = get_user_model()
+
+SAMPLE_EMAILS = (
+    ("test1@EXAMPLE.com", "test1@example.com"),
+    ("Test2@example.com", "Test2@example.com"),
+    ("TEST3@example.com", "TEST3@example.com"),
+    ("test4@example.com", "test4@example.com"),
+)
+
 
 def create_user(email="user@example.com", password="test123"):
     """Create a sample user."""
-    return get_user_model().objects.create_user(email, password)
+    return User.objects.create_user(email, password)
 
 
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
 class ModelTests(TestCase):
     def test_create_user_with_email_successful(self):
         email = "test@example.com"
         password = "password123"
 
-        user = get_user_model().objects.create_user(
-            email=email, password=password
-        )
+        user = User.objects.create_user(email=email, password=password)
 
         self.assertEqual(user.email, email)
         self.assertTrue(user.check_password(password))
 
     def test_new_user_email_normalized(self):
+        for raw, normalized in SAMPLE_EMAILS:
+            with self.subTest(email=raw):
+                self.assertEqual(User.objects.normalize_email(raw), normalized)
 
-        sample_emails = [
-            ["test1@EXAMPLE.com", "test1@example.com"],
-            ["Test2@example.com", "Test2@example.com"],
-            ["TEST3@example.com", "TEST3@example.com"],
-            ["test4@example.com", "test4@example.com"],
-        ]
-
-        for email in sample_emails:
-            user = get_user_model().objects.create_user(
-                email=email[0], password="test123"
-            )
-            self.assertEqual(user.email, email[1])
+        raw, normalized = SAMPLE_EMAILS[0]
+        user = User.objects.create_user(email=raw, password="test123")
+        self.assertEqual(user.email, normalized)
 
     def test_new_user_without_email_raises_error(self):
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user(
-                email=None, password="test123"
-            )
+            User.objects.create_user(email=None, password="test123")
 
     def test_create_new_superuser(self):
-        user = get_user_model().objects.create_superuser(
-            "test@example.com", "test123"
-        )
+        user = User.objects.create_superuser("test@example.com", "test123")
 
         self.assertTrue(user.is_superuser)
         self.assertTrue(user.is_staff)
 
     def test_create_recipe(self):
         """Test creating a new recipe"""
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email="test@example.com", password="test123"
         )
 
@@ -2,13 +2,28 @@
 Serializers for recipe APIs
 """
 
+import copy
+
 from rest_framework import serializers
 
 from core.models import Recipe
 from core.models import Tag
 
 
-class TagSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Build model serializer fields once per class and copy them after"""
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+
+        return copy.deepcopy(self._fields_cache[cls])
+
+
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for tag objects"""
 
     class Meta:
@@ -17,7 +32,7 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the recipe object"""
 
     tags = TagSerializer(many=True, required=False)
@@ -3,51 +3,74 @@ Test for recipe API's
 """
 
 from decimal import Decimal
+from types import MappingProxyType
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from core.models import Recipe, Tag
 
-from recipe.serializers import (
-    RecipeSerializer,
-    RecipeDetailSerializer,
-)
+from recipe.serializers import RecipeDetailSerializer
+from recipe.views import RecipeViewSet
+
+User = get_user_model()
 
 RECIPES_URL = reverse("recipes:recipe-list")
 
+RECIPE_DETAIL_VIEW = RecipeViewSet.as_view(
+    {"get": "retrieve", "put": "update", "patch": "partial_update"}
+)
+
+_PRICE_5 = Decimal("5.00")
+_PRICE_7 = Decimal("7.00")
+_PRICE_20 = Decimal("20.00")
+
+_DEFAULT_RECIPE = MappingProxyType(
+    {
+        "title": "Sample recipe",
+        "time_minutes": 10,
+        "price": _PRICE_5,
+        "description": "",
+        "link": "",
+    }
+)
+
 
 def detail_url(recipe_id):
     """Return recipe detail URL."""
     return reverse("recipes:recipe-detail", args=[recipe_id])
 
 
-def create_recipe(user, **params):
-    """Create and return a sample recipe."""
-    defaults = {
-        "title": "Sample recipe",
-        "time_minutes": 10,
-        "price": Decimal("5.00"),
-        "description": "Sample recipe description.",
-        "link": "http:/example.com/recipe.pdf",
-    }
+def build_recipe(user, **params):
+    """Return an unsaved sample recipe."""
+    defaults = dict(_DEFAULT_RECIPE)
     defaults.update(params)
 
-    recipe = Recipe.objects.create(user=user, **defaults)
+    return Recipe(user=user, **defaults)
+
+
+def create_recipe(user, **params):
+    """Create and return a sample recipe."""
+    recipe = build_recipe(user, **params)
+    recipe.save()
 
     return recipe
 
 
 def create_user(**params):
     """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
-class PublicRecipeApiTests(TestCase):
+class PublicRecipeApiTests(SimpleTestCase):
     """Test unauthenticated recipe API access."""
 
     def setUp(self):
@@ -60,52 +83,78 @@ class PublicRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com", password="password123"
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
+        self.factory = APIRequestFactory()
+
+    def call_detail_view(self, method, recipe_id, data=None):
+        """Call the recipe detail view directly, skipping middleware."""
+        request = getattr(self.factory, method)(detail_url(recipe_id), data)
+        force_authenticate(request, user=self.user)
+
+        return RECIPE_DETAIL_VIEW(request, pk=recipe_id)
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes."""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
-
-        res = self.client.get(RECIPES_URL)
+        recipes = Recipe.objects.bulk_create(
+            [
+                build_recipe(user=self.user),
+                build_recipe(user=self.user, title="Another recipe"),
+            ]
+        )
 
-        recipes = Recipe.objects.all().order_by("-id")
-        serializer = RecipeSerializer(recipes, many=True)
+        with self.assertNumQueries(2):
+            res = self.client.get(RECIPES_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [r["id"] for r in res.data], [r.id for r in reversed(recipes)]
+        )
+        self.assertEqual(res.data[0]["title"], recipes[1].title)
+        self.assertEqual(Decimal(res.data[0]["price"]), recipes[1].price)
 
     def test_recipe_list_limited_to_user(self):
         """Test retrieving recipes for user."""
-        user2 = get_user_model().objects.create_user(
-            "other@example.com", "password123"
-        )
-
-        create_recipe(user=user2)
-        create_recipe(user=self.user)
+        user2 = User.objects.create_user("other@example.com", "password123")
 
-        res = self.client.get(RECIPES_URL)
+        Recipe.objects.bulk_create(
+            [
+                build_recipe(user=user2, title="Other user's recipe"),
+                build_recipe(user=self.user),
+            ]
+        )
 
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
+        with self.assertNumQueries(2):
+            res = self.client.get(RECIPES_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]["title"], "Sample recipe")
 
     def test_get_recipe_detail(self):
         """Test getting a recipe detail."""
-        recipe = create_recipe(user=self.user)
+        recipe = create_recipe(
+            user=self.user,
+            description="Sample recipe description.",
+            link="http:/example.com/recipe.pdf",
+        )
 
-        url = detail_url(recipe.id)
-        res = self.client.get(url)
+        with self.assertNumQueries(2):
+            res = self.call_detail_view("get", recipe.id)
 
         serializer = RecipeDetailSerializer(recipe)
 
@@ -116,7 +165,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             "title": "Chocolate cheesecake",
             "time_minutes": 30,
-            "price": Decimal("5.00"),
+            "price": _PRICE_5,
         }
 
         res = self.client.post(RECIPES_URL, payload)
@@ -136,10 +185,9 @@ class PrivateRecipeApiTests(TestCase):
         )
         payload = {"title": "New recipe title"}
 
-        url = detail_url(recipe.id)
-        self.client.patch(url, payload)
+        self.call_detail_view("patch", recipe.id, payload)
 
-        recipe.refresh_from_db()
+        recipe.refresh_from_db(fields=["title", "link", "user"])
         self.assertEqual(recipe.title, payload["title"])
         self.assertEqual(recipe.link, original_link)
         self.assertEqual(recipe.user, self.user)
@@ -150,13 +198,14 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             "title": "Updated recipe title",
             "time_minutes": 25,
-            "price": Decimal("7.00"),
+            "price": _PRICE_7,
         }
 
-        url = detail_url(recipe.id)
-        self.client.put(url, payload)
+        self.call_detail_view("put", recipe.id, payload)
 
-        recipe.refresh_from_db()
+        recipe.refresh_from_db(
+            fields=["title", "time_minutes", "price", "user"]
+        )
         for k, v in payload.items():
             self.assertEqual(getattr(recipe, k), v)
         self.assertEqual(recipe.user, self.user)
@@ -180,7 +229,7 @@ class PrivateRecipeApiTests(TestCase):
         url = detail_url(recipe.id)
         self.client.patch(url, payload)
 
-        recipe.refresh_from_db()
+        recipe.refresh_from_db(fields=["user"])
         self.assertNotEqual(recipe.user, self.user)
         self.assertEqual(recipe.user, user2)
 
@@ -200,23 +249,22 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             "title": "Avocado lime cheesecake",
             "time_minutes": 60,
-            "price": Decimal("20.00"),
+            "price": _PRICE_20,
             "tags": [{"name": "Vegan"}, {"name": "Dessert"}],
         }
 
         res = self.client.post(RECIPES_URL, payload, format="json")
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        tags = recipe.tags
-        self.assertEqual(tags.count(), 2)
+        recipe = Recipe.objects.prefetch_related("tags").get(user=self.user)
+        tags = recipe.tags.all()
+        self.assertEqual(len(tags), 2)
 
         for tag in payload["tags"]:
-            exists = recipe.tags.filter(
-                name=tag["name"], user=self.user
-            ).exists()
+            exists = any(
+                t.name == tag["name"] and t.user_id == self.user.id
+                for t in tags
+            )
             self.assertTrue(exists)
 
     def test_create_recipe_with_existent_tag(self):
@@ -227,22 +275,22 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             "title": "Avocado lime cheesecake",
             "time_minutes": 60,
-            "price": Decimal("20.00"),
+            "price": _PRICE_20,
             "tags": [{"name": "Vegan"}, {"name": "Dessert"}],
         }
 
-        res = self.client.post(RECIPES_URL, payload, format="json")
+        with self.assertNumQueries(9):
+            res = self.client.post(RECIPES_URL, payload, format="json")
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        tags = recipe.tags
-        self.assertEqual(tags.count(), 2)
-        self.assertIn(tag1, recipe.tags.all())
+        recipe = Recipe.objects.prefetch_related("tags").get(user=self.user)
+        tags = recipe.tags.all()
+        self.assertEqual(len(tags), 2)
+        self.assertIn(tag1, tags)
 
         for tag in payload["tags"]:
-            exists = recipe.tags.filter(
-                name=tag["name"], user=self.user
-            ).exists()
+            exists = any(
+                t.name == tag["name"] and t.user_id == self.user.id
+                for t in tags
+            )
             self.assertTrue(exists)
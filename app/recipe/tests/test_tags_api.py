@@ -3,7 +3,7 @@ Tests for the tags API.
 """
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -26,7 +26,7 @@ def create_user(email="user@example.com", password="test123"):
     return get_user_model().objects.create_user(email, password)
 
 
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test the publicly available tags API."""
 
     def setUp(self):
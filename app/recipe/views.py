@@ -20,7 +20,11 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return objects for the current authenticated user only"""
-        return self.queryset.filter(user=self.request.user).order_by("-id")
+        return (
+            self.queryset.filter(user=self.request.user)
+            .prefetch_related("tags")
+            .order_by("-id")
+        )
 
     def get_serializer_class(self):
         """Return appropriate serializer class"""